@@ -1,19 +1,245 @@
 import math
+import numbers
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 import matplotlib.widgets as widgets
+from matplotlib.transforms import Bbox
 import json
 import os
 from datetime import datetime
 import numpy as np
 
-class ProjectileMotionSimulator:
+try:
+    from utils_numba import traj_batch_kernel
+except ImportError:
+    traj_batch_kernel = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class Simulator:
+    """Headless projectile bookkeeping, trajectory computation and JSON I/O"""
+    TRAJECTORY_KEYS = ('t', 'x', 'y', 'vx', 'vy', 'speed')
+    
     def __init__(self):
+        self.projectiles = []
+        self.current_projectile_id = 0
+        
+        # Default parameters for new projectiles
+        self.default_params = {
+            'v0': 20,
+            'theta': 45,
+            'g': 9.8,
+            'y0': 0,
+            'color': '#3498DB',
+            'name': 'Projectile'
+        }
+        
+        # Available colors for projectiles
+        self.available_colors = ['#3498DB', '#E74C3C', '#2ECC71', '#F39C12', 
+                               '#9B59B6', '#1ABC9C', '#D35400', '#C0392B']
+    
+    def check_params(self, params):
+        """Raise ValueError unless the launch parameters are finite numbers in range"""
+        for key in ('v0', 'theta', 'g', 'y0'):
+            value = params[key]
+            if (isinstance(value, bool) or not isinstance(value, numbers.Real)
+                    or not math.isfinite(value)):
+                raise ValueError(f"{key} must be a finite number, got {value!r}")
+        if params['g'] <= 0:
+            raise ValueError(f"g must be positive, got {params['g']!r}")
+        if params['y0'] < 0:
+            raise ValueError(f"y0 must not be negative, got {params['y0']!r}")
+    
+    def new_projectile(self, params, projectile_id):
+        """Build a projectile record from its launch parameters"""
+        self.check_params(params)
+        return {
+            'id': projectile_id,
+            'name': params['name'],
+            'v0': params['v0'],
+            'theta': params['theta'],
+            'g': params['g'],
+            'y0': params['y0'],
+            'color': params['color'],
+            'points': {},
+            'dirty': True,
+            'trajectory_line': None,
+            'point': None,
+            '_sin': None,
+            '_cos': None,
+            '_table': None
+        }
+    
+    def add_projectile(self, params=None):
+        """Add a new projectile"""
+        if params is None:
+            params = self.default_params.copy()
+            params['name'] = f'Projectile_{self.current_projectile_id}'
+            params['color'] = self.available_colors[self.current_projectile_id % len(self.available_colors)]
+            self.current_projectile_id += 1
+        
+        projectile = self.new_projectile(params, len(self.projectiles))
+        self.projectiles.append(projectile)
+        return projectile
+    
+    def remove_projectile(self):
+        """Remove the last projectile and return it, or None if there is none"""
+        if self.projectiles:
+            return self.projectiles.pop()
+        return None
+    
+    def clear_all_projectiles(self):
+        """Clear all projectiles"""
+        self.projectiles.clear()
+        self.current_projectile_id = 0
+    
+    def calculate_trajectory(self, v0, theta, g, y0):
+        """Calculate projectile motion as arrays of t, x, y, vx, vy and speed"""
+        projectile = {'v0': v0, 'theta': theta, 'g': g, 'y0': y0, '_sin': None, '_cos': None}
+        self.calculate_trajectories([projectile])
+        return projectile['points']
+    
+    def get_launch_trig(self, projectile):
+        """Return the sine and cosine of a projectile's launch angle, cached on the projectile"""
+        if projectile['_sin'] is None:
+            theta_rad = math.radians(projectile['theta'])
+            projectile['_sin'] = math.sin(theta_rad)
+            projectile['_cos'] = math.cos(theta_rad)
+        return projectile['_sin'], projectile['_cos']
+    
+    def calculate_trajectories(self, projectiles):
+        """Calculate trajectories for several projectiles at once on a shared time grid"""
+        dt = 0.05
+        v0 = np.array([p['v0'] for p in projectiles], dtype=float)
+        g = np.array([p['g'] for p in projectiles], dtype=float)
+        y0 = np.array([p['y0'] for p in projectiles], dtype=float)
+        sin_t, cos_t = np.array([self.get_launch_trig(p) for p in projectiles]).T
+        
+        vx0 = v0 * cos_t
+        vy0 = v0 * sin_t
+        t_max = (vy0 + np.sqrt(np.maximum(vy0**2 + 2 * g * y0, 0))) / g
+        
+        # One (projectiles x timesteps) grid shared by every projectile, filled
+        # in place so no temporaries are allocated per quantity
+        lengths = np.floor(t_max / dt).astype(np.int64) + 1
+        t = np.arange(lengths.max()) * dt
+        x, y, vx, vy, speed = np.empty((5, len(projectiles), len(t)))
+        if traj_batch_kernel is not None:
+            # Compiled gufunc runs one projectile row per thread and stops each
+            # row at its own landing sample
+            traj_batch_kernel(v0, sin_t, cos_t, g, y0, lengths, t, x, y, vx, vy, speed)
+        else:
+            np.multiply(vx0[:, None], t, out=x)
+            np.multiply(-0.5 * g[:, None], t, out=y)
+            y += vy0[:, None]
+            y *= t
+            y += y0[:, None]
+            vx[:] = vx0[:, None]
+            np.multiply(-g[:, None], t, out=vy)
+            vy += vy0[:, None]
+            np.hypot(vx0[:, None], vy, out=speed)
+        
+        # Rows end at their last sample before landing; the clamp only absorbs
+        # rounding and skips the unused tail of shorter rows
+        np.maximum(y, 0, out=y, where=np.arange(len(t)) < lengths[:, None])
+        
+        for i, p in enumerate(projectiles):
+            n = lengths[i]
+            p['points'] = {'t': t[:n], 'x': x[i, :n], 'y': y[i, :n],
+                           'vx': vx[i, :n], 'vy': vy[i, :n], 'speed': speed[i, :n]}
+            p['dirty'] = False
+            p['_table'] = None
+    
+    def simulate(self):
+        """Compute trajectories for projectiles added or changed since the last run"""
+        dirty = [p for p in self.projectiles if p['dirty']]
+        if dirty:
+            self.calculate_trajectories(dirty)
+    
+    def sample_points(self, points, rows=20):
+        """Gather evenly spaced rows of a trajectory for the data table"""
+        n = len(points['t'])
+        idx = np.linspace(0, n - 1, min(rows, n), dtype=int)
+        return np.column_stack([points[key][idx] for key in self.TRAJECTORY_KEYS])
+    
+    def get_table(self, projectile):
+        """Return the sampled data table as formatted cell strings, cached until recomputed"""
+        if projectile['_table'] is None:
+            projectile['_table'] = np.char.mod('%8.2f', self.sample_points(projectile['points'])).tolist()
+        return projectile['_table']
+    
+    def load_points(self, points):
+        """Convert exported trajectory lists back to arrays, or None if they are incomplete"""
+        if not isinstance(points, dict) or any(key not in points for key in self.TRAJECTORY_KEYS):
+            return None
+        arrays = {key: np.asarray(points[key], dtype=float) for key in self.TRAJECTORY_KEYS}
+        shapes = {values.shape for values in arrays.values()}
+        if len(shapes) != 1 or arrays['t'].ndim != 1 or not len(arrays['t']):
+            return None
+        return arrays
+    
+    def export_to_json(self, filename=None):
+        """Write projectile parameters and computed trajectories to a JSON file"""
+        if filename is None:
+            filename = f"projectiles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        
+        projectiles = []
+        for p in self.projectiles:
+            entry = {key: p[key] for key in ('name', 'v0', 'theta', 'g', 'y0', 'color')}
+            if p['points'] and not p['dirty']:
+                # orjson encodes the arrays straight from their buffers
+                if orjson is not None:
+                    entry['points'] = {key: np.ascontiguousarray(values) 
+                                       for key, values in p['points'].items()}
+                else:
+                    entry['points'] = {key: values.tolist() for key, values in p['points'].items()}
+            projectiles.append(entry)
+        
+        data = {'exported_at': datetime.now().isoformat(), 'projectiles': projectiles}
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
+        return filename
+    
+    def import_from_json(self, filename=None):
+        """Replace the projectiles with those from a JSON export (latest one by default)"""
+        if filename is None:
+            exports = sorted(f for f in os.listdir('.')
+                             if f.startswith('projectiles_') and f.endswith('.json'))
+            if not exports:
+                raise FileNotFoundError("no projectiles_*.json export found")
+            filename = exports[-1]
+        
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        
+        if not isinstance(data, dict) or not isinstance(data.get('projectiles'), list):
+            raise ValueError(f"{filename} is not a projectile export")
+        
+        projectiles = []
+        for entry in data['projectiles']:
+            projectile = self.new_projectile(entry, len(projectiles))
+            points = self.load_points(entry.get('points'))
+            if points is not None:
+                projectile['points'] = points
+                projectile['dirty'] = False
+            projectiles.append(projectile)
+        
+        self.projectiles[:] = projectiles
+        self.current_projectile_id = len(projectiles)
+        return filename
+
+class ProjectileMotionSimulator(Simulator):
+    def __init__(self):
+        super().__init__()
         self.current_points = []
         self.animations = []
         self.is_animating = False
-        self.projectiles = []
-        self.current_projectile_id = 0
         
         # Modern color palette
         self.colors = {
@@ -28,19 +254,12 @@ class ProjectileMotionSimulator:
             'grid': '#7F8C8D'
         }
         
-        # Default parameters for new projectiles
-        self.default_params = {
-            'v0': 20,
-            'theta': 45,
-            'g': 9.8,
-            'y0': 0,
-            'color': '#3498DB',
-            'name': 'Projectile'
-        }
+        self._brightness = {c: self.get_brightness(c) for c in self.available_colors}
         
-        # Available colors for projectiles
-        self.available_colors = ['#3498DB', '#E74C3C', '#2ECC71', '#F39C12', 
-                               '#9B59B6', '#1ABC9C', '#D35400', '#C0392B']
+        # Figure pixels under the overlay texts, captured after every full render
+        self.background = None
+        self.background_renderer = None
+        self.overlay_extents = {}
         
         plt.style.use('dark_background')
         self.setup_ui()
@@ -76,6 +295,13 @@ class ProjectileMotionSimulator:
         self.ax_io = self.fig.add_subplot(gs_main[2, :])
         self.setup_import_export()
         
+        # Texts that change on their own are kept out of full renders so on_draw
+        # can capture a clean background behind them and paint them on top
+        self.overlays = [self.status_text, self.projectile_list_text, self.color_text]
+        for text in self.overlays:
+            text.set_animated(True)
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+        
         # Initialize with one projectile
         self.add_projectile()
         
@@ -143,19 +369,19 @@ class ProjectileMotionSimulator:
         ax_add = self.fig.add_subplot(management_gs[0, 0])
         self.add_btn = widgets.Button(ax_add, '➕ Add Projectile', 
                                     color='#27AE60', hovercolor='#2ECC71')
-        self.add_btn.on_clicked(self.add_projectile)
+        self.add_btn.on_clicked(lambda event: self.add_projectile())
         ax_add.set_title("Add New", color=self.colors['text_light'], fontsize=9)
         
         ax_remove = self.fig.add_subplot(management_gs[0, 1])
         self.remove_btn = widgets.Button(ax_remove, '🗑️ Remove Last', 
                                        color='#E74C3C', hovercolor='#EC7063')
-        self.remove_btn.on_clicked(self.remove_projectile)
+        self.remove_btn.on_clicked(lambda event: self.remove_projectile())
         ax_remove.set_title("Remove", color=self.colors['text_light'], fontsize=9)
         
         ax_clear = self.fig.add_subplot(management_gs[0, 2])
         self.clear_btn = widgets.Button(ax_clear, '🧹 Clear All', 
                                       color='#F39C12', hovercolor='#F7DC6F')
-        self.clear_btn.on_clicked(self.clear_all_projectiles)
+        self.clear_btn.on_clicked(lambda event: self.clear_all_projectiles())
         ax_clear.set_title("Clear", color=self.colors['text_light'], fontsize=9)
         
         ax_run = self.fig.add_subplot(management_gs[0, 3])
@@ -249,11 +475,13 @@ class ProjectileMotionSimulator:
         ax_color.set_facecolor(self.colors['panel_bg'])
         ax_color.set_title('🎨 Color', color=self.colors['text_light'], pad=10)
         ax_color.axis('off')
+        default_color = self.default_params['color']
+        default_brightness = self._brightness.get(default_color) or self.get_brightness(default_color)
         self.color_text = ax_color.text(0.5, 0.3, self.default_params['color'], fontsize=11, 
                                       ha='center', 
                                       bbox=dict(facecolor=self.default_params['color'], 
                                               edgecolor='white', boxstyle="round,pad=0.8"),
-                                      color='white' if self.get_brightness(self.default_params['color']) < 128 else 'black')
+                                      color='white' if default_brightness < 128 else 'black')
         
         # Color cycle button
         ax_color_cycle = self.fig.add_subplot(settings_gs[3, 1])
@@ -279,13 +507,13 @@ class ProjectileMotionSimulator:
         ax_export = self.fig.add_subplot(io_gs[0, 0])
         self.export_btn = widgets.Button(ax_export, '📤 Export to JSON', 
                                        color='#27AE60', hovercolor='#58D68D')
-        self.export_btn.on_clicked(self.export_to_json)
+        self.export_btn.on_clicked(lambda event: self.export_to_json())
         ax_export.set_title("Export", color=self.colors['text_light'], fontsize=9)
         
         ax_import = self.fig.add_subplot(io_gs[0, 1])
         self.import_btn = widgets.Button(ax_import, '📥 Import from JSON', 
                                        color='#3498DB', hovercolor='#5DADE2')
-        self.import_btn.on_clicked(self.import_from_json)
+        self.import_btn.on_clicked(lambda event: self.import_from_json())
         ax_import.set_title("Import", color=self.colors['text_light'], fontsize=9)
         
         ax_save_img = self.fig.add_subplot(io_gs[0, 2])
@@ -312,8 +540,8 @@ class ProjectileMotionSimulator:
     
     def get_brightness(self, hex_color):
         """Calculate brightness of a hex color to determine text color"""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        value = int(hex_color.lstrip('#'), 16)
+        r, g, b = (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
         return (r * 299 + g * 587 + b * 114) / 1000
     
     def cycle_color(self, event=None):
@@ -329,80 +557,53 @@ class ProjectileMotionSimulator:
         self.color_text.set_text(new_color)
         self.color_text.set_bbox(dict(facecolor=new_color, edgecolor='white', 
                                     boxstyle="round,pad=0.8"))
-        self.color_text.set_color('white' if self.get_brightness(new_color) < 128 else 'black')
-        plt.draw()
+        brightness = self._brightness.get(new_color) or self.get_brightness(new_color)
+        self.color_text.set_color('white' if brightness < 128 else 'black')
+        self.redraw_overlay(self.color_text)
     
     def reset_view(self, event=None):
         """Reset the plot view"""
         self.auto_scale_plot()
         self.update_status("View reset")
     
-    def calculate_trajectory(self, v0, theta, g, y0):
-        """Calculate projectile motion points"""
-        theta_rad = math.radians(theta)
-        dt = 0.05
-        
-        discriminant = (v0 * math.sin(theta_rad))**2 + 2 * g * y0
-        if discriminant < 0:
-            discriminant = 0
-        t_max = (v0 * math.sin(theta_rad) + math.sqrt(discriminant)) / g
-        
-        points = []
-        t = 0
-        while t <= t_max:
-            x = v0 * math.cos(theta_rad) * t
-            y = y0 + v0 * math.sin(theta_rad) * t - 0.5 * g * t**2
-            if y < 0:
-                y = 0
-            vx = v0 * math.cos(theta_rad)
-            vy = v0 * math.sin(theta_rad) - g * t
-            speed = math.sqrt(vx**2 + vy**2)
-            points.append([t, x, y, vx, vy, speed])
-            t += dt
-        
-        return points
-    
-    def add_projectile(self, event=None, params=None):
+    def add_projectile(self, params=None):
         """Add a new projectile"""
-        if params is None:
-            params = self.default_params.copy()
-            params['name'] = f'Projectile_{self.current_projectile_id}'
-            params['color'] = self.available_colors[self.current_projectile_id % len(self.available_colors)]
-            self.current_projectile_id += 1
-        
-        projectile = {
-            'id': len(self.projectiles),
-            'name': params['name'],
-            'v0': params['v0'],
-            'theta': params['theta'],
-            'g': params['g'],
-            'y0': params['y0'],
-            'color': params['color'],
-            'points': [],
-            'trajectory_line': None,
-            'point': None
-        }
-        
-        self.projectiles.append(projectile)
+        projectile = super().add_projectile(params)
+        self.create_artists(projectile)
         self.update_projectile_list()
         self.update_status(f"✅ Added {projectile['name']}")
-        
-    def remove_projectile(self, event=None):
+        return projectile
+    
+    def create_artists(self, projectile):
+        """Create the trajectory line and marker, which live as long as the projectile"""
+        projectile['trajectory_line'], = self.ax_traj.plot([], [], color=projectile['color'],
+                                                           linewidth=2.5, label=projectile['name'])
+        projectile['point'], = self.ax_traj.plot([], [], 'o', color=projectile['color'],
+                                                 markersize=8)
+    
+    def remove_artists(self, projectile):
+        """Remove a projectile's artists from the trajectory plot"""
+        projectile['trajectory_line'].remove()
+        projectile['point'].remove()
+    
+    def remove_projectile(self):
         """Remove the last projectile"""
-        if self.projectiles:
-            removed = self.projectiles.pop()
+        removed = super().remove_projectile()
+        if removed is not None:
+            self.remove_artists(removed)
+            self.clear_plot()
             self.update_projectile_list()
             self.update_status(f"🗑️ Removed {removed['name']}")
-            self.clear_plot()
         else:
             self.update_status("⚠️ No projectiles to remove")
     
-    def clear_all_projectiles(self, event=None):
+    def clear_all_projectiles(self):
         """Clear all projectiles"""
-        self.projectiles.clear()
-        self.current_projectile_id = 0
-        self.update_projectile_list()
+        for p in self.projectiles:
+            self.remove_artists(p)
+        super().clear_all_projectiles()
         self.clear_plot()
+        self.update_projectile_list()
         self.update_status("🧹 All projectiles cleared")
     
     def update_current_projectile(self, event=None):
@@ -418,8 +619,14 @@ class ProjectileMotionSimulator:
             'g': self.g_slider.val,
             'y0': self.y0_slider.val,
             'name': self.name_text.get_text(),
-            'color': self.color_text.get_text()
+            'color': self.color_text.get_text(),
+            '_sin': None,
+            '_cos': None,
+            'dirty': True
         })
+        current['trajectory_line'].set(color=current['color'], label=current['name'])
+        current['point'].set_color(current['color'])
+        self.redraw_figure()
         
         self.update_projectile_list()
         self.update_status(f"🔄 Updated {current['name']}")
@@ -433,4 +640,228 @@ class ProjectileMotionSimulator:
             for i, p in enumerate(self.projectiles):
                 color_box = f"█"  # Color indicator
                 text += f"{color_box} {i+1}. {p['name']}\n"
-                text += f"   v₀={p['v0']} m/s, θ={p['theta']}°, h={p['y0']} m\n\n"
\ No newline at end of file
+                text += f"   v₀={p['v0']} m/s, θ={p['theta']}°, h={p['y0']} m\n\n"
+        
+        self.projectile_list_text.set_text(text)
+        self.redraw_overlay(self.projectile_list_text)
+    
+    def update_status(self, message):
+        """Update the status message"""
+        self.status_text.set_text(message)
+        self.redraw_overlay(self.status_text)
+    
+    def on_draw(self, event):
+        """Capture the figure behind the overlay texts after a full render, then paint them"""
+        renderer = event.renderer
+        if event.canvas.supports_blit:
+            self.background = event.canvas.copy_from_bbox(self.fig.bbox)
+            self.background_renderer = renderer
+        for text in self.overlays:
+            text.draw(renderer)
+            self.overlay_extents[text] = self.get_overlay_extent(text, renderer)
+    
+    def get_overlay_extent(self, text, renderer):
+        """Return the display extent of an overlay text, including its box"""
+        extents = [text.get_window_extent(renderer)]
+        patch = text.get_bbox_patch()
+        if patch is not None:
+            text.update_bbox_position_size(renderer)
+            extents.append(patch.get_window_extent(renderer))
+        return Bbox.union(extents).padded(2)
+    
+    def redraw_overlay(self, changed):
+        """Repaint an overlay text over the captured background and blit only that area"""
+        canvas = self.fig.canvas
+        if self.background is None or canvas.get_renderer() is not self.background_renderer:
+            canvas.draw_idle()
+            return
+        
+        # Cover the old and new text, plus any overlay they overlap, so that
+        # every pixel restored from the background gets its overlays back
+        renderer = self.background_renderer
+        self.overlay_extents[changed] = Bbox.union(
+            [self.overlay_extents[changed], self.get_overlay_extent(changed, renderer)])
+        region = self.overlay_extents[changed]
+        members = {changed}
+        grown = True
+        while grown:
+            grown = False
+            for text in self.overlays:
+                if text not in members and self.overlay_extents[text].overlaps(region):
+                    members.add(text)
+                    region = Bbox.union([region, self.overlay_extents[text]])
+                    grown = True
+        region = Bbox.intersection(region, self.fig.bbox)
+        if region is None:
+            return
+        
+        # Agg indexes saved regions from the top-left corner, in whole pixels
+        x0, y0, x1, y1 = region.extents
+        x0, y0, x1, y1 = math.floor(x0), math.floor(y0), math.ceil(x1), math.ceil(y1)
+        height = round(self.fig.bbox.height)
+        canvas.restore_region(self.background, bbox=(x0, height - y1, x1, height - y0), xy=(0, 0))
+        for text in self.overlays:
+            if text in members:
+                text.draw(renderer)
+                self.overlay_extents[text] = self.get_overlay_extent(text, renderer)
+        canvas.blit(Bbox.from_extents(x0, y0, x1, y1))
+    
+    def redraw_figure(self):
+        """Schedule a full render after a change to artists inside the captured background"""
+        self.background = None
+        self.fig.canvas.draw_idle()
+    
+    def run_simulation(self, event=None):
+        """Compute all trajectories and animate them"""
+        if not self.projectiles:
+            self.update_status("⚠️ No projectiles to simulate")
+            return
+        
+        self.clear_plot()
+        
+        self.simulate()
+        
+        self.ax_traj.legend(loc='upper right', facecolor=self.colors['panel_bg'], 
+                          edgecolor=self.colors['text_light'], 
+                          labelcolor=self.colors['text_light'])
+        self.auto_scale_plot()
+        self.update_data_display()
+        
+        # Resolve everything the frame callback needs once, so each frame only
+        # takes ndarray views instead of re-walking the projectile dicts
+        tracks = [(p['trajectory_line'], p['point'], 
+                   np.asarray(p['points']['x']), np.asarray(p['points']['y']))
+                  for p in self.projectiles]
+        n_frames = max(len(xs) for _, _, xs, _ in tracks)
+        
+        # Blit by hand: the moving artists are marked animated so the captured
+        # background holds only static content (axes, legend, data table), then
+        # each tick restores it and redraws just the lines and markers
+        canvas = self.fig.canvas
+        background = None
+        if canvas.supports_blit:
+            self.set_trajectories_animated(True)
+            canvas.draw()
+            background = canvas.copy_from_bbox(self.ax_traj.bbox)
+        frames = iter(range(n_frames))
+        
+        def update():
+            frame = next(frames)
+            if background is not None:
+                canvas.restore_region(background)
+            for line, point, xs, ys in tracks:
+                i = min(frame, len(xs) - 1)
+                line.set_xdata(xs[:i + 1])
+                line.set_ydata(ys[:i + 1])
+                point.set_xdata(xs[i:i + 1])
+                point.set_ydata(ys[i:i + 1])
+                if background is not None:
+                    self.ax_traj.draw_artist(line)
+                    self.ax_traj.draw_artist(point)
+            if background is not None:
+                canvas.blit(self.ax_traj.bbox)
+            else:
+                canvas.draw_idle()
+            if frame == n_frames - 1:
+                timer.stop()
+                self.is_animating = False
+                self.set_trajectories_animated(False)
+                canvas.draw_idle()
+        
+        timer = canvas.new_timer(interval=50)
+        timer.add_callback(update)
+        self.is_animating = True
+        self.animations.append(timer)
+        timer.start()
+        self.update_status(f"🚀 Simulating {len(self.projectiles)} projectile(s)")
+    
+    def set_trajectories_animated(self, animated):
+        """Include or exclude the trajectory artists from regular figure draws"""
+        for p in self.projectiles:
+            p['trajectory_line'].set_animated(animated)
+            p['point'].set_animated(animated)
+    
+    def update_data_display(self):
+        """Show flight statistics for every projectile and a table for the current one"""
+        text = ""
+        for p in self.projectiles:
+            points = p['points']
+            text += (f"● {p['name']}: T={points['t'][-1]:.2f}s  R={points['x'][-1]:.2f}m  "
+                     f"H={points['y'].max():.2f}m\n")
+        
+        current = self.projectiles[-1]
+        text += f"\n📋 {current['name']}\n"
+        text += f"{'t':>8}{'x':>8}{'y':>8}{'vx':>8}{'vy':>8}{'v':>8}\n"
+        for row in self.get_table(current):
+            text += "".join(row) + "\n"
+        self.data_text.set_text(text.rstrip())
+    
+    def clear_plot(self):
+        """Stop running animations and empty all trajectory artists"""
+        for timer in self.animations:
+            timer.stop()
+        self.animations.clear()
+        self.is_animating = False
+        self.set_trajectories_animated(False)
+        
+        for p in self.projectiles:
+            p['trajectory_line'].set_data([], [])
+            p['point'].set_data([], [])
+        legend = self.ax_traj.get_legend()
+        if legend is not None:
+            legend.remove()
+        
+        self.data_text.set_text('🚀 Click "Run Simulation" to start')
+        self.redraw_figure()
+    
+    def auto_scale_plot(self):
+        """Fit the axes limits to the computed trajectories"""
+        trajectories = [p['points'] for p in self.projectiles if p['points']]
+        if not trajectories:
+            self.ax_traj.set_xlim(0, 1)
+            self.ax_traj.set_ylim(0, 1)
+        else:
+            x_max = max(points['x'].max() for points in trajectories)
+            y_max = max(points['y'].max() for points in trajectories)
+            self.ax_traj.set_xlim(0, x_max * 1.1 or 1)
+            self.ax_traj.set_ylim(0, y_max * 1.2 or 1)
+        self.redraw_figure()
+    
+    def export_to_json(self, filename=None):
+        """Export projectiles to JSON and report the result"""
+        try:
+            filename = super().export_to_json(filename)
+        except OSError as e:
+            self.update_status(f"❌ Export failed: {e}")
+            return None
+        self.update_status(f"📤 Exported {len(self.projectiles)} projectile(s) to {filename}")
+        return filename
+    
+    def import_from_json(self, filename=None):
+        """Import projectiles from JSON, rebuilding the display once for the whole batch"""
+        previous = list(self.projectiles)
+        try:
+            filename = super().import_from_json(filename)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.update_status(f"❌ Import failed: {e}")
+            return None
+        
+        for p in previous:
+            self.remove_artists(p)
+        for p in self.projectiles:
+            self.create_artists(p)
+        self.clear_plot()
+        self.update_projectile_list()
+        self.update_status(f"📥 Imported {len(self.projectiles)} projectile(s) from {filename}")
+        return filename
+    
+    def save_as_image(self, event=None):
+        """Save the whole figure as a PNG image"""
+        filename = f"projectile_motion_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        try:
+            self.fig.savefig(filename, dpi=150, facecolor=self.fig.get_facecolor(),
+                             bbox_inches='tight')
+        except OSError as e:
+            self.update_status(f"❌ Save failed: {e}")
+            return
+        self.update_status(f"🖼️ Saved {filename}")
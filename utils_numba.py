@@ -0,0 +1,19 @@
+import math
+from numba import guvectorize
+
+
+@guvectorize(['void(float64, float64, float64, float64, float64, int64, float64[:], '
+              'float64[:], float64[:], float64[:], float64[:], float64[:])'],
+             '(),(),(),(),(),(),(n)->(n),(n),(n),(n),(n)', target='parallel', cache=True,
+             fastmath=True)
+def traj_batch_kernel(v0, sin_t, cos_t, g, y0, length, t, x, y, vx, vy, speed):
+    """Compiled per-projectile kernel filling the first `length` samples of a shared time grid"""
+    vx0 = v0 * cos_t
+    vy0 = v0 * sin_t
+    for i in range(length):
+        ti = t[i]
+        x[i] = vx0 * ti
+        y[i] = y0 + (vy0 - 0.5 * g * ti) * ti
+        vx[i] = vx0
+        vy[i] = vy0 - g * ti
+        speed[i] = math.hypot(vx0, vy[i])